@@ -1,25 +1,14 @@
 """
 Script to debug the logging issue with EmergencyManager tests.
 """
+import argparse
 import logging
 import sys
 import pytest
 from unittest.mock import patch
 
-def main():
-    # Configure root logger for console output
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        stream=sys.stdout
-    )
-
-    # Log some diagnostic information
-    logging.info("Starting debug script")
-    logging.info(f"Python version: {sys.version}")
-    logging.info(f"Pytest version: {pytest.__version__}")
-    
-    # Try to diagnose the mock issue
+def diagnose_mock_level():
+    """Reproduce the MagicMock-as-log-level check that fails in the tests."""
     logging.info("Testing mock behavior that might be causing the error")
     try:
         from unittest.mock import MagicMock
@@ -36,6 +25,31 @@ def main():
     except Exception as e:
         logging.error(f"Mock test produced error: {e}")
         logging.exception("Traceback:")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--diagnose',
+        action='store_true',
+        help='Also run the MagicMock log-level diagnostic before the test'
+    )
+    args = parser.parse_args(argv)
+
+    # Configure root logger for console output
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stdout
+    )
+
+    # Log some diagnostic information
+    logging.info("Starting debug script")
+    logging.info(f"Python version: {sys.version}")
+    logging.info(f"Pytest version: {pytest.__version__}")
+    
+    # Try to diagnose the mock issue
+    if args.diagnose:
+        diagnose_mock_level()
     
     # Run only the problematic test with detailed output
     logging.info("Running the failing test with verbose output")
@@ -12,14 +12,14 @@ logger = logging.getLogger(__name__)
 class MockExchange:
     """Mock exchange interface for demonstration."""
     async def buy(self, trading_pair: str, size: float, price: float):
-        logger.info(f"Mock buy: {size} {trading_pair} at {price}")
+        logger.info("Mock buy: %s %s at %s", size, trading_pair, price)
         return {
             'order_id': '12345',
             'status': 'filled'
         }
 
     async def sell(self, trading_pair: str, size: float, price: float):
-        logger.info(f"Mock sell: {size} {trading_pair} at {price}")
+        logger.info("Mock sell: %s %s at %s", size, trading_pair, price)
         return {
             'order_id': '12346',
             'status': 'filled'
@@ -28,7 +28,7 @@ class MockExchange:
 class MockRiskManager:
     """Mock risk manager for demonstration."""
     async def check_order_risk(self, trading_pair: str, side: str, size: float, price: float) -> bool:
-        logger.info(f"Checking risk for {side} {size} {trading_pair} at {price}")
+        logger.info("Checking risk for %s %s %s at %s", side, size, trading_pair, price)
         return True
 
 async def run_trading_example():
@@ -54,15 +54,15 @@ async def run_trading_example():
             size=1.0,
             price=50000.0
         )
-        logger.info(f"Buy order executed: {buy_result}")
+        logger.info("Buy order executed: %s", buy_result)
         
         # Check position
         position = await trading.get_position(trading_pair)
-        logger.info(f"Current position: {position}")
+        logger.info("Current position: %s", position)
         
         # Get trading statistics
         stats = trading.get_daily_stats()
-        logger.info(f"Trading stats: {stats}")
+        logger.info("Trading stats: %s", stats)
         
         # Adjust position
         adjust_result = await trading.adjust_position(
@@ -70,18 +70,18 @@ async def run_trading_example():
             target_size=0.5,  # Reduce position by half
             current_price=55000.0
         )
-        logger.info(f"Position adjusted: {adjust_result}")
+        logger.info("Position adjusted: %s", adjust_result)
         
         # Final position check
         final_position = await trading.get_position(trading_pair)
-        logger.info(f"Final position: {final_position}")
+        logger.info("Final position: %s", final_position)
         
         # Graceful shutdown
         await trading.shutdown()
         logger.info("Trading system shutdown complete")
 
     except Exception as e:
-        logger.error(f"Error during trading: {str(e)}")
+        logger.error("Error during trading: %s", e)
         raise
 
 def main():
@@ -91,7 +91,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Trading example stopped by user")
     except Exception as e:
-        logger.error(f"Trading example failed: {str(e)}")
+        logger.error("Trading example failed: %s", e)
 
 if __name__ == "__main__":
     main()
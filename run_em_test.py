@@ -2,72 +2,46 @@
 Script to run the emergency manager test with detailed output.
 """
 import subprocess
-import os
 import sys
 
-def main():
-    """Run the test and print detailed output."""
-    print("Running emergency manager tests...")
-    
-    # Command to run the specific test
+def _run_pytest(target):
+    """Run pytest on a single target and return its exit code."""
     cmd = [
         sys.executable, "-m", "pytest",
-        "tests/test_core/test_emergency_manager.py::test_perform_emergency_shutdown",
+        target,
         "-v",  # Verbose output
         "--no-header",  # No header info
         "-s",  # Don't capture stdout/stderr
     ]
+    # Let pytest write straight to our console
+    sys.stdout.flush()
+    return subprocess.run(cmd, check=False).returncode
+
+def main():
+    """Run the test and print detailed output."""
+    print("Running emergency manager tests...")
     
     try:
-        # Run the command and capture output
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=os.getcwd()
+        # Run the specific test
+        returncode = _run_pytest(
+            "tests/test_core/test_emergency_manager.py::test_perform_emergency_shutdown"
         )
-        stdout, stderr = process.communicate()
-        
-        # Print the output
-        print("\n--- STDOUT ---")
-        print(stdout)
-        
-        if stderr:
-            print("\n--- STDERR ---")
-            print(stderr)
         
         # Check exit code
-        if process.returncode == 0:
+        if returncode == 0:
             print("\n✅ Test passed successfully!")
         else:
-            print(f"\n❌ Test failed with exit code {process.returncode}")
+            print(f"\n❌ Test failed with exit code {returncode}")
             
         # Run all tests as well
         print("\n\nRunning all emergency manager tests...")
-        cmd[2] = "tests/test_core/test_emergency_manager.py"
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=os.getcwd()
-        )
-        stdout, stderr = process.communicate()
-        
-        # Print the output
-        print("\n--- STDOUT ---")
-        print(stdout)
-        
-        if stderr:
-            print("\n--- STDERR ---")
-            print(stderr)
+        returncode = _run_pytest("tests/test_core/test_emergency_manager.py")
         
         # Check exit code
-        if process.returncode == 0:
+        if returncode == 0:
             print("\n✅ All tests passed successfully!")
         else:
-            print(f"\n❌ Some tests failed with exit code {process.returncode}")
+            print(f"\n❌ Some tests failed with exit code {returncode}")
         
     except Exception as e:
         print(f"Error running tests: {e}")
@@ -3,7 +3,10 @@ Main script to run the trading system.
 Simple startup script for personal use.
 """
 import asyncio
+import functools
+import json
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
 import os
@@ -17,17 +20,46 @@ from src.core.config_manager import ConfigManager
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-log_file = log_dir / f"trading_{datetime.now().strftime('%Y%m%d')}.log"
-
-
 logger = logging.getLogger(__name__)
 
+def _setup_logging():
+    """Configure console logging plus a buffered, rotating daily log file."""
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    log_file = log_dir / f"trading_{datetime.now().strftime('%Y%m%d')}.log"
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=3
+    )
+    file_handler.setFormatter(formatter)
+    # Buffer records so the file is written in batches; errors flush immediately
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=file_handler
+    )
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(console_handler)
+    root.addHandler(buffered_handler)
+
+# Ticker subscription sent on every (re)connect
+_SUBSCRIBE_MSG = json.dumps({
+    "type": "subscribe",
+    "product_ids": ["BTC-USD"],
+    "channels": ["ticker"],
+})
+
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """Return the shared ConfigManager, creating it on first use."""
+    return ConfigManager()
+
 async def coinbase_stream():
     """Connect to Coinbase and stream real-time data."""
-    config_manager = ConfigManager()
+    config_manager = get_config()
     api_key = config_manager.coinbase_api_key
     private_key = config_manager.coinbase_private_key
 
@@ -40,7 +72,7 @@ async def coinbase_stream():
 
     async def handle_message(message):
         """Process incoming messages from the Coinbase stream."""
-        logger.info(f"Received message: {message}")
+        logger.info("Received message: %s", message)
 
     async def subscribe():
         """Subscribe to the Coinbase stream."""
@@ -49,16 +81,11 @@ async def coinbase_stream():
             ws_client.message_callback = handle_message
             ws_client.start()
             # Subscribe to channels
-            subscribe_message = {
-                "type": "subscribe",
-                "product_ids": ["BTC-USD"],
-                "channels": ["ticker"],
-            }
-            await ws_client.send(json.dumps(subscribe_message))
+            await ws_client.send(_SUBSCRIBE_MSG)
             await asyncio.sleep(3600)  # Run for 1 hour
             ws_client.close()
         except Exception as e:
-            logger.error(f"Error connecting to Coinbase: {e}")
+            logger.error("Error connecting to Coinbase: %s", e)
 
     await subscribe()
 
@@ -73,16 +100,20 @@ async def run_trading():
         # Start Coinbase stream
         asyncio.create_task(coinbase_stream())
 
+        pairs = tuple(trading.config.trading_pairs)
+
         while trading.is_running:
             try:
-                # Get current positions
-                for pair in trading.config.trading_pairs:
-                    position = await trading.get_position(pair)
-                    logger.info(f"Current position for {pair}: {position}")
+                # Get current positions, querying all pairs concurrently
+                positions = await asyncio.gather(
+                    *(trading.get_position(pair) for pair in pairs)
+                )
+                for pair, position in zip(pairs, positions):
+                    logger.info("Current position for %s: %s", pair, position)
 
                 # Get trading statistics
                 stats = trading.get_daily_stats()
-                logger.info(f"Daily trading statistics: {stats}")
+                logger.info("Daily trading statistics: %s", stats)
 
                 # Wait before next update
                 await asyncio.sleep(60)  # Update every minute
@@ -92,23 +123,24 @@ async def run_trading():
                 await trading.shutdown()
                 break
             except Exception as e:
-                logger.error(f"Error during trading: {str(e)}")
+                logger.error("Error during trading: %s", e)
                 # Continue running despite errors
                 await asyncio.sleep(5)
 
     except Exception as e:
-        logger.error(f"Critical error: {str(e)}")
+        logger.error("Critical error: %s", e)
         raise
 
 def main():
     """Entry point for the trading system."""
+    _setup_logging()
     try:
         logger.info("Starting trading system...")
         asyncio.run(run_trading())
     except KeyboardInterrupt:
         logger.info("Trading system stopped by user")
     except Exception as e:
-        logger.error(f"Trading system failed: {str(e)}")
+        logger.error("Trading system failed: %s", e)
         raise
 
 if __name__ == "__main__":
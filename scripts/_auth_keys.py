@@ -0,0 +1,46 @@
+"""Shared loader for the Coinbase API key file used by the auth test scripts."""
+import json
+from functools import lru_cache
+
+KEY_FILE = 'config/cdp_api_key_2.json'
+
+@lru_cache(maxsize=1)
+def load_keys():
+    """Return (api_key, private_key_pem), reading the key file only once."""
+    with open(KEY_FILE, 'rb') as f:
+        api_keys = json.load(f)
+    return api_keys['name'], api_keys['privateKey']
+
+@lru_cache(maxsize=1)
+def load_key_id():
+    """Return the key ID from an organizations/org_id/apiKeys/key_id name.
+
+    Names not in that format are returned unchanged.
+    """
+    api_key = load_keys()[0]
+    if api_key.count('/') >= 3:
+        return api_key.rsplit('/', 1)[-1]
+    return api_key
+
+@lru_cache(maxsize=1)
+def load_secret_bytes():
+    """Return the private key string UTF-8 encoded, for use as an HMAC key."""
+    return load_keys()[1].encode('utf-8')
+
+@lru_cache(maxsize=1)
+def load_private_key_der():
+    """Parse the PEM private key once and return it as PKCS8 DER bytes."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
+    _, private_key_pem = load_keys()
+    private_key = serialization.load_pem_private_key(
+        private_key_pem.encode('utf-8'),
+        password=None,
+        backend=default_backend()
+    )
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
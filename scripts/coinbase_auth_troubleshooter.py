@@ -1,10 +1,76 @@
 import time
 import hmac
 import hashlib
-import base64
+import ssl
 import requests
 import json
+import os
+from binascii import b2a_base64
+from functools import lru_cache
 from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated probes reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+def sha256_backend():
+    """
+    Report which implementation serves SHA-256 for request signing.
+    Returns 'openssl' when hashlib is backed by OpenSSL, 'builtin' otherwise.
+    """
+    if hashlib.sha256().__class__.__module__ == '_hashlib':
+        return 'openssl'
+    return 'builtin'
+
+# Probed once at import; signing never re-checks the backend
+SHA256_BACKEND = sha256_backend()
+
+def check_sha256_backend():
+    """Print the SHA-256 backend and warn when signing runs on the slow path."""
+    backend = SHA256_BACKEND
+    print(f"SHA-256 backend: {backend} ({ssl.OPENSSL_VERSION})")
+    if backend != 'openssl':
+        print("Warning: hashlib is not using OpenSSL; request signing will be slower")
+    return backend == 'openssl'
+
+CREDENTIALS_PATH = "config/cdp_api_key_2.json"
+
+# Request used to probe authentication; the signed message is
+# timestamp + method + path, so the constant tail is encoded once
+_TEST_METHOD = 'GET'
+_TEST_REQUEST_PATH = '/accounts'
+_TEST_SIGN_SUFFIX = (_TEST_METHOD + _TEST_REQUEST_PATH).encode('ascii')
+
+@lru_cache(maxsize=4)
+def _load_credentials(path, mtime_ns):
+    """
+    Parse the API key file. Cached per (path, mtime), so an edited
+    file is re-read on the next call.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        credentials = json.load(f)
+    api_secret = credentials["privateKey"]
+    return credentials["name"], api_secret, api_secret.encode('utf-8')
+
+def load_credentials(path=CREDENTIALS_PATH):
+    """Return (api_key, api_secret, api_secret_bytes) from the API key file."""
+    return _load_credentials(path, os.stat(path).st_mtime_ns)
+
+@lru_cache(maxsize=4)
+def _primed_hmac(key):
+    """
+    HMAC-SHA256 object with the key's inner/outer pads already absorbed.
+    hmac.digest() re-derives the pads on every call; copying this object
+    skips that work, which is most of the cost for short messages.
+    """
+    return hmac.new(key, digestmod='sha256')
+
+def sign(key, message):
+    """Return the raw HMAC-SHA256 of message (bytes) under key (bytes)."""
+    signer = _primed_hmac(key).copy()
+    signer.update(message)
+    return signer.digest()
 
 def setup_coinbase_auth():
     """
@@ -13,10 +79,7 @@ def setup_coinbase_auth():
     """
     # Load API credentials from file
     try:
-        with open("config/cdp_api_key_2.json", "r") as f:
-            credentials = json.load(f)
-        api_key = credentials["name"]
-        api_secret = credentials["privateKey"]
+        api_key, api_secret, hmac_key = load_credentials()
     except FileNotFoundError:
         print("Error: config/cdp_api_key_2.json not found.")
         return None
@@ -28,17 +91,15 @@ def setup_coinbase_auth():
         return None
 
     # Test the authentication
-    timestamp = str(int(time.time()))
-    request_path = '/accounts'
-    method = 'GET'
+    timestamp = str(time.time_ns() // 1_000_000_000)
+    request_path = _TEST_REQUEST_PATH
     
     # Create the message to sign
-    message = timestamp + method + request_path
+    message = timestamp.encode('ascii') + _TEST_SIGN_SUFFIX
     
     # Create the signature using HMAC
-    hmac_key = api_secret.encode('utf-8')
-    signature = hmac.new(hmac_key, message.encode('utf-8'), hashlib.sha256)
-    signature_b64 = base64.b64encode(signature.digest()).decode('utf-8')
+    signature = sign(hmac_key, message)
+    signature_b64 = b2a_base64(signature, newline=False).decode('ascii')
     
     # Set up the headers
     headers = {
@@ -50,7 +111,7 @@ def setup_coinbase_auth():
     
     # Make a test request
     api_url = "https://api.exchange.coinbase.com"
-    response = requests.get(f"{api_url}{request_path}", headers=headers)
+    response = _SESSION.get(f"{api_url}{request_path}", headers=headers)
     
     if response.status_code == 200:
         print("Authentication successful!")
@@ -70,4 +131,5 @@ def setup_coinbase_auth():
         return None
 
 if __name__ == '__main__':
+    check_sha256_backend()
     setup_coinbase_auth()
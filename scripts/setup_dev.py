@@ -1,11 +1,27 @@
 """
 Development environment setup script.
 """
-import os
 import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
+PRE_COMMIT_HOOK = """#!/bin/sh
+echo "Running pre-commit checks..."
+
+# Run tests
+python -m pytest tests/ || exit 1
+
+# Run black
+python -m black . --check || exit 1
+
+# Run isort
+python -m isort . --check-only || exit 1
+
+# Run flake8
+python -m flake8 . || exit 1
+"""
+
 def check_python_version():
     """Check if Python version meets requirements."""
     required_version = (3, 8)
@@ -15,13 +31,29 @@ def check_python_version():
         print(f"Error: Python {required_version[0]}.{required_version[1]} or higher is required")
         sys.exit(1)
 
+# Distributions from the [dev,test] extras; the pre-commit hook runs pytest,
+# black, isort and flake8, and the test suite needs the pytest plugins
+DEV_PACKAGES = (
+    "pytest", "pytest-asyncio", "pytest-mock", "pytest-cov",
+    "black", "isort", "flake8", "mypy",
+)
+
+def _installed(package):
+    """Return True if the given distribution is already installed."""
+    try:
+        version(package)
+        return True
+    except PackageNotFoundError:
+        return False
+
 def install_dependencies(dev_mode=True):
-    """Install project dependencies."""
+    """Install project dependencies, skipping pip when already installed."""
     try:
         # Install base dependencies
-        subprocess.run([sys.executable, "-m", "pip", "install", "-e", "."], check=True)
+        if not _installed("crypto_trader_clean"):
+            subprocess.run([sys.executable, "-m", "pip", "install", "-e", "."], check=True)
         
-        if dev_mode:
+        if dev_mode and not all(_installed(p) for p in DEV_PACKAGES):
             # Install development dependencies
             subprocess.run([
                 sys.executable, "-m", "pip", "install", 
@@ -49,32 +81,21 @@ def create_config():
 
 def setup_git_hooks():
     """Set up Git hooks for development."""
-    hooks_dir = Path(".git/hooks")
-    if not hooks_dir.exists():
-        print("Git hooks directory not found. Initializing git repository...")
+    git_dir = Path(".git")
+    if not git_dir.is_dir():
+        print("Git repository not found. Initializing git repository...")
         subprocess.run(["git", "init"], check=True)
 
+    hooks_dir = git_dir / "hooks"
+    hooks_dir.mkdir(exist_ok=True)
+
     # Create pre-commit hook
     pre_commit = hooks_dir / "pre-commit"
-    with open(pre_commit, 'w') as f:
-        f.write("""#!/bin/sh
-echo "Running pre-commit checks..."
-
-# Run tests
-python -m pytest tests/ || exit 1
-
-# Run black
-python -m black . --check || exit 1
-
-# Run isort
-python -m isort . --check-only || exit 1
-
-# Run flake8
-python -m flake8 . || exit 1
-""")
+    with open(pre_commit, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(PRE_COMMIT_HOOK)
     
     # Make hook executable
-    os.chmod(pre_commit, 0o755)
+    pre_commit.chmod(0o755)
     print("Git hooks installed")
 
 def setup_dev_environment():
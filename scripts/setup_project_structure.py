@@ -1,5 +1,5 @@
 """Setup script for crypto_trader_clean project structure."""
-import os
+import sys
 from pathlib import Path
 
 def create_directory_structure():
@@ -30,10 +30,13 @@ def create_directory_structure():
         'scripts'
     ]
     
-    # Create directories
+    # Create directories, collecting messages for a single write at the end
+    messages = []
     for dir_path in directories:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
-        print(f"Created directory: {dir_path}")
+        path = Path(dir_path)
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+        messages.append(f"Created directory: {dir_path}")
         
     # Create .gitkeep files for empty directories
     empty_dirs = [
@@ -45,7 +48,9 @@ def create_directory_structure():
     for dir_path in empty_dirs:
         gitkeep = Path(dir_path) / '.gitkeep'
         gitkeep.touch()
-        print(f"Created .gitkeep in: {dir_path}")
+        messages.append(f"Created .gitkeep in: {dir_path}")
+        
+    sys.stdout.write('\n'.join(messages) + '\n')
 
 def main():
     """Main entry point."""
@@ -0,0 +1,169 @@
+"""Coinbase API authentication checks, one subcommand per scenario.
+
+Usage:
+    python scripts/test_auth.py {simple,streaming,auth,auth-invalid,public,all}
+    python -m scripts.test_auth {simple,streaming,auth,auth-invalid,public,all}
+
+All subcommands share the key file load, HTTP session and HMAC signer, so
+running ``all`` pays interpreter start-up and the requests import once.
+"""
+import argparse
+import hashlib
+import hmac
+import sys
+import time
+from base64 import b64encode
+from functools import lru_cache
+
+import requests
+
+try:
+    from scripts._auth_keys import load_keys, load_key_id, load_secret_bytes
+except ImportError:  # run as a script, with scripts/ on sys.path
+    from _auth_keys import load_keys, load_key_id, load_secret_bytes
+
+BASE_URL = "https://api.coinbase.com"
+ACCOUNTS_ENDPOINT = "/api/v3/brokerage/accounts"
+PRODUCTS_ENDPOINT = "/api/v3/brokerage/products"
+TICKER_ENDPOINT = "/api/v3/brokerage/products/BTC-USD/ticker"
+
+# Shared session so every request reuses one connection
+_SESSION = requests.Session()
+
+@lru_cache(maxsize=1)
+def _hmac_base():
+    """Return an HMAC primed with the secret, to be copied per message."""
+    return hmac.new(load_secret_bytes(), b'', hashlib.sha256)
+
+def sign(message, secret=None):
+    """Return the base64 HMAC-SHA256 signature of message as bytes.
+
+    Signs with the configured secret unless another one is given.
+    requests accepts bytes header values, so the signature is never decoded.
+    """
+    if secret is not None:
+        return b64encode(hmac.digest(secret, message.encode('utf-8'), 'sha256'))
+    h = _hmac_base().copy()
+    h.update(message.encode('utf-8'))
+    return b64encode(h.digest())
+
+def _print_headers(headers):
+    """Print headers with bytes values shown as text."""
+    shown = {name: value.decode('ascii') if isinstance(value, bytes) else value
+             for name, value in headers.items()}
+    print(f"Request Headers: {shown}")
+
+def signed_headers(key, path, method="GET", body="", secret=None):
+    """Sign a request for path and return its CB-ACCESS headers."""
+    timestamp = str(time.time_ns() // 1_000_000_000)
+    message = timestamp + method + path + body
+    print(f"Message to sign: {message}")
+    headers = {
+        "Content-Type": "application/json",
+        "CB-ACCESS-KEY": key,
+        "CB-ACCESS-SIGN": sign(message, secret),
+        "CB-ACCESS-TIMESTAMP": timestamp.encode('ascii')
+    }
+    _print_headers(headers)
+    return headers
+
+
+def get(path, headers=None, check=True):
+    """GET path, printing the status and body. Return True on success."""
+    print(f"Making request to: {BASE_URL}{path}")
+    try:
+        response = _SESSION.get(BASE_URL + path, headers=headers, timeout=10)
+        print(f"Response Status Code: {response.status_code}")
+        # The body is already JSON text; print it as-is
+        print(f"Response: {response.text}")
+        if check:
+            response.raise_for_status()
+        return True
+    except requests.exceptions.RequestException as e:
+        print(f"Request failed: {e}")
+        if e.response is not None:
+            print(f"Response status code: {e.response.status_code}")
+            print(f"Response body: {e.response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
+    return False
+
+def _print_key_id():
+    """Print the key ID and a prefix of the private key."""
+    _, private_key = load_keys()
+    print(f"Using API Key ID: {load_key_id()}")
+    print(f"Private Key (first 20 chars): {private_key[:20]}...")
+
+def run_simple():
+    """Sign a products request with the key ID."""
+    _print_key_id()
+    headers = signed_headers(load_key_id(), PRODUCTS_ENDPOINT)
+    return get(PRODUCTS_ENDPOINT, headers)
+
+def run_streaming():
+    """Sign an accounts request the way coinbase_streaming.py does."""
+    _print_key_id()
+    headers = signed_headers(load_key_id(), ACCOUNTS_ENDPOINT)
+    return get(ACCOUNTS_ENDPOINT, headers)
+
+def run_auth():
+    """Sign an accounts request with the full API key name."""
+    api_key, private_key = load_keys()
+    print(f"API Key: {api_key}")
+    print(f"Private Key (first 20 chars): {private_key[:20]}...")
+    headers = signed_headers(api_key, ACCOUNTS_ENDPOINT)
+    return get(ACCOUNTS_ENDPOINT, headers)
+
+def run_auth_invalid():
+    """Sign an accounts request with a wrong secret and expect a 401."""
+    _print_key_id()
+    headers = signed_headers(load_key_id(), ACCOUNTS_ENDPOINT, secret=b'invalid-secret')
+    print(f"Making request to: {BASE_URL}{ACCOUNTS_ENDPOINT}")
+    try:
+        response = _SESSION.get(BASE_URL + ACCOUNTS_ENDPOINT, headers=headers, timeout=10)
+    except requests.exceptions.RequestException as e:
+        print(f"Request failed: {e}")
+        return False
+    print(f"Response Status Code: {response.status_code}")
+    if response.status_code == 401:
+        print("Invalid signature rejected as expected")
+        return True
+    print(f"Expected 401 for an invalid signature, got {response.status_code}")
+    print(f"Response: {response.text}")
+    return False
+
+def run_public():
+    """Request two market data endpoints without authentication."""
+    ok = get(PRODUCTS_ENDPOINT, check=False)
+    print("\nTrying another endpoint...")
+    return get(TICKER_ENDPOINT, check=False) and ok
+
+COMMANDS = {
+    'simple': run_simple,
+    'streaming': run_streaming,
+    'auth': run_auth,
+    'auth-invalid': run_auth_invalid,
+    'public': run_public,
+}
+
+def main(argv=None):
+    """Run the selected check, or every check for 'all'.
+
+    Returns 0 if every request succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description='Coinbase API authentication checks')
+    parser.add_argument('command', choices=[*COMMANDS, 'all'])
+    args = parser.parse_args(argv)
+
+    names = list(COMMANDS) if args.command == 'all' else [args.command]
+    failed = False
+    try:
+        for name in names:
+            print(f"\n=== {name} ===")
+            failed |= not COMMANDS[name]()
+    finally:
+        _SESSION.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
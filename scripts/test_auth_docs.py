@@ -1,24 +1,21 @@
-import json
 import requests
 import hmac
-import hashlib
 import time
 import base64
-import os
+try:
+    from scripts._auth_keys import load_keys, load_key_id, load_secret_bytes
+except ImportError:  # run as a script, with scripts/ on sys.path
+    from _auth_keys import load_keys, load_key_id, load_secret_bytes
 
-# Load API keys from file
-with open('config/cdp_api_key_2.json', 'r') as f:
-    api_keys = json.load(f)
+# Shared session so back-to-back requests reuse one connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
-api_key = api_keys['name']
-private_key = api_keys['privateKey']
+# Load API keys from file
+_, private_key = load_keys()
 
 # Extract the actual API key ID from the full string
-api_key_parts = api_key.split('/')
-if len(api_key_parts) >= 4:
-    api_key_id = api_key_parts[-1]  # Get the last part which should be the key ID
-else:
-    api_key_id = api_key  # Use as is if not in the expected format
+api_key_id = load_key_id()
 
 print(f"Using API Key ID: {api_key_id}")
 print(f"Private Key (first 20 chars): {private_key[:20]}...")
@@ -32,7 +29,7 @@ auth_endpoint = "/users/self/verify"
 request_path = endpoint
 
 # Set the timestamp (in seconds)
-timestamp = str(int(time.time()))
+timestamp = str(time.time_ns() // 1_000_000_000)
 method = "GET"
 request_path = endpoint
 body = ""
@@ -40,45 +37,46 @@ body = ""
 # Create the prehash string by concatenating timestamp, HTTP method, and auth_endpoint
 prehash_string = timestamp + method + auth_endpoint + body
 print(f"Prehash string: {prehash_string}")
+# Both signing attempts below use the same message, so encode it once
+prehash_bytes = prehash_string.encode('utf-8')
 
 request_path = endpoint
 
+# Headers shared by both attempts; only the signature changes between them
+_HEADERS = {
+    "CB-ACCESS-KEY": api_key_id,  # API key
+    "CB-ACCESS-SIGN": "",  # Base64-encoded signature, set per attempt
+    "CB-ACCESS-TIMESTAMP": timestamp,  # Timestamp for the request
+    "Content-Type": "application/json"  # Content type
+}
+
 # Create the signature by signing the prehash with the private key using HMAC-SHA256
 try:
     # Try using the private key directly
-    signature = hmac.new(
-        private_key.encode('utf-8'),
-        prehash_string.encode('utf-8'),
-        digestmod=hashlib.sha256
-    ).digest()
+    signature = hmac.digest(
+        load_secret_bytes(),
+        prehash_bytes,
+        'sha256'
+    )
     
     # Base64 encode the signature
     signature_b64 = base64.b64encode(signature).decode('utf-8')
     print(f"Signature: {signature_b64}")
     
     # Set the headers according to the documentation
-    headers = {
-        "CB-ACCESS-KEY": api_key_id,  # API key
-        "CB-ACCESS-SIGN": signature_b64,  # Base64-encoded signature
-        "CB-ACCESS-TIMESTAMP": timestamp,  # Timestamp for the request
-        "Content-Type": "application/json"  # Content type
-    }
+    _HEADERS["CB-ACCESS-SIGN"] = signature_b64
     
-    print(f"Request Headers: {headers}")
+    print(f"Request Headers: {_HEADERS}")
     print(f"Making request to: {base_url}{endpoint}")
     
     # Make the request
-    response = requests.get(base_url + endpoint, headers=headers)
+    response = _SESSION.get(base_url + endpoint, headers=_HEADERS, timeout=10)
     
     # Print response status
     print(f"Response Status Code: {response.status_code}")
     
-    # Try to parse response as JSON
-    try:
-        response_json = response.json()
-        print(f"Response: {json.dumps(response_json, indent=2)}")
-    except:
-        print(f"Raw Response: {response.text}")
+    # The body is already JSON text; print it as-is
+    print(f"Response: {response.text}")
     
     # Raise exception for non-2xx status codes
     response.raise_for_status()
@@ -102,39 +100,30 @@ if 'response' not in locals() or response.status_code != 200:
             print(f"Extracted key content (first 20 chars): {key_content[:20]}...")
             
             # Create signature with just the key content
-            signature = hmac.new(
+            signature = hmac.digest(
                 key_content.encode('utf-8'),
-                prehash_string.encode('utf-8'),
-                digestmod=hashlib.sha256
-            ).digest()
+                prehash_bytes,
+                'sha256'
+            )
             
             # Base64 encode the signature
             signature_b64 = base64.b64encode(signature).decode('utf-8')
             print(f"Alternative Signature: {signature_b64}")
             
             # Set the headers
-            headers = {
-                "CB-ACCESS-KEY": api_key_id,
-                "CB-ACCESS-SIGN": signature_b64,
-                "CB-ACCESS-TIMESTAMP": timestamp,
-                "Content-Type": "application/json"
-            }
+            _HEADERS["CB-ACCESS-SIGN"] = signature_b64
             
-            print(f"Alternative Request Headers: {headers}")
+            print(f"Alternative Request Headers: {_HEADERS}")
             print(f"Making alternative request to: {base_url}{endpoint}")
             
             # Make the request
-            response = requests.get(base_url + endpoint, headers=headers)
+            response = _SESSION.get(base_url + endpoint, headers=_HEADERS, timeout=10)
             
             # Print response status
             print(f"Alternative Response Status Code: {response.status_code}")
             
-            # Try to parse response as JSON
-            try:
-                response_json = response.json()
-                print(f"Alternative Response: {json.dumps(response_json, indent=2)}")
-            except:
-                print(f"Alternative Raw Response: {response.text}")
+            # The body is already JSON text; print it as-is
+            print(f"Alternative Response: {response.text}")
             
             # Raise exception for non-2xx status codes
             response.raise_for_status()
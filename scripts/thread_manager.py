@@ -7,13 +7,108 @@ import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+ACTIVE_DIR = Path('thread_management/active_thread')
+COMPLETED_DIR = Path('thread_management/completed_threads')
+INDEX_PATH = Path('thread_management/index.json')
 
 def setup_logging() -> None:
     """Configure logging for the thread manager."""
     log_dir = Path('thread_management/logs')
     log_dir.mkdir(parents=True, exist_ok=True)
     
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Read a thread JSON file in one binary read."""
+    return json.loads(path.read_bytes())
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write a thread JSON file, keeping the 4-space indented layout."""
+    path.write_bytes(json.dumps(data, indent=4).encode('utf-8'))
+
+def _index_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields list_threads shows for a thread config.
+
+    Older thread files use 'title' instead of 'name'.
+    """
+    return {
+        'name': data.get('name', data.get('title', '')),
+        'status': data.get('status', '')
+    }
+
+def _build_index() -> Dict[str, Dict[str, Any]]:
+    """Scan the thread directories and build the list_threads index."""
+    index = {'active': {}, 'completed': {}}
+    for section, directory in (('active', ACTIVE_DIR), ('completed', COMPLETED_DIR)):
+        if not directory.exists():
+            continue
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    data = _read_json(Path(entry.path))
+                    index[section][data['thread_id']] = _index_entry(data)
+    return index
+
+def _index_is_fresh(index: Dict[str, Dict[str, Any]]) -> bool:
+    """Return True if no thread file or folder changed after the index was written.
+
+    Both folders are scanned once: the index is stale if either folder or any
+    thread file is not older than it, or if the number of thread files no
+    longer matches the number of indexed threads. Equal timestamps count as
+    stale, since coarse filesystem clocks can give a change the same mtime as
+    the index write before it.
+    """
+    index_mtime = INDEX_PATH.stat().st_mtime_ns
+    file_count = 0
+    for directory in (ACTIVE_DIR, COMPLETED_DIR):
+        if not directory.exists():
+            continue
+        if directory.stat().st_mtime_ns >= index_mtime:
+            return False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    file_count += 1
+                    if entry.stat().st_mtime_ns >= index_mtime:
+                        return False
+    return file_count == sum(len(entries) for entries in index.values())
+
+def _current_index() -> Tuple[Dict[str, Dict[str, Any]], bool]:
+    """Return (index, rebuilt), rebuilding the index if it is missing or stale."""
+    try:
+        index = _read_json(INDEX_PATH)
+    except (FileNotFoundError, ValueError):
+        index = None
+    if index is not None and _index_is_fresh(index):
+        return index, False
+    return _build_index(), True
+
+def load_index() -> Dict[str, Dict[str, Any]]:
+    """Load the thread index, rebuilding and saving it if it is missing or stale."""
+    index, rebuilt = _current_index()
+    if rebuilt:
+        _write_json(INDEX_PATH, index)
+    return index
+
+def _update_index(index: Dict[str, Dict[str, Any]], thread_id: str,
+                  section: str, data: Dict[str, Any], *changed: Path) -> None:
+    """Record a thread's name and status in the given index section and save it.
+
+    Callers load the index before changing any thread file, so the freshness
+    check does not see their own write and force a full rebuild. changed
+    lists the thread files the caller wrote.
+    """
+    for entries in index.values():
+        entries.pop(thread_id, None)
+    index[section][thread_id] = _index_entry(data)
+    _write_json(INDEX_PATH, index)
+    
+    # The index now reflects the caller's writes; on filesystems with coarse
+    # timestamps they can share its mtime, so move the index just past them
+    latest = max(path.stat().st_mtime_ns
+                 for path in (ACTIVE_DIR, COMPLETED_DIR, *changed) if path.exists())
+    if latest >= INDEX_PATH.stat().st_mtime_ns:
+        os.utime(INDEX_PATH, ns=(latest + 1, latest + 1))
 
 def load_template(thread_id: str) -> Dict[str, Any]:
     """Load the thread template configuration.
@@ -24,16 +119,14 @@ def load_template(thread_id: str) -> Dict[str, Any]:
     # Try specific template first (e.g., thread_005_init.json)
     specific_template = Path(f'thread_management/templates/thread_{thread_id.lower()}_init.json')
     if specific_template.exists():
-        with open(specific_template) as f:
-            return json.load(f)
+        return _read_json(specific_template)
             
     # Fall back to default template
     template_path = Path('thread_management/templates/thread_init_template.json')
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
         
-    with open(template_path) as f:
-        return json.load(f)
+    return _read_json(template_path)
 
 def init_thread(thread_id: str) -> None:
     """Initialize a new thread configuration with a standardized thread ID.
@@ -50,14 +143,17 @@ def init_thread(thread_id: str) -> None:
     template['thread_id'] = thread_id
     template['start_time'] = datetime.now().isoformat()
     
+    # Load the index before the thread folder changes
+    index, _ = _current_index()
+    
     # Create thread directory
     thread_dir = Path('thread_management/active_thread')
     thread_dir.mkdir(parents=True, exist_ok=True)
     
     # Save thread configuration as THREAD_XXX.json
     config_path = thread_dir / f"{thread_id}.json"
-    with open(config_path, 'w') as f:
-        json.dump(template, f, indent=4)
+    _write_json(config_path, template)
+    _update_index(index, thread_id, 'active', template, config_path)
         
     logging.info(f"Initialized thread {thread_id}")
     
@@ -67,8 +163,7 @@ def get_thread_status(thread_id: str) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Thread config not found: {thread_id}")
         
-    with open(config_path) as f:
-        return json.load(f)
+    return _read_json(config_path)
         
 def complete_thread(thread_id: str) -> None:
     """Mark a thread as complete and archive it."""
@@ -76,6 +171,9 @@ def complete_thread(thread_id: str) -> None:
     status['status'] = 'completed'
     status['completion_time'] = datetime.now().isoformat()
     
+    # Load the index before the thread folders change
+    index, _ = _current_index()
+    
     # Create archive directory
     archive_dir = Path('thread_management/completed_threads')
     archive_dir.mkdir(parents=True, exist_ok=True)
@@ -84,32 +182,25 @@ def complete_thread(thread_id: str) -> None:
     src_path = Path(f'thread_management/active_thread/{thread_id}.json')
     dst_path = archive_dir / f"{thread_id}.json"
     
-    with open(dst_path, 'w') as f:
-        json.dump(status, f, indent=4)
+    _write_json(dst_path, status)
         
     os.remove(src_path)
+    _update_index(index, thread_id, 'completed', status, dst_path)
     logging.info(f"Completed and archived thread {thread_id}")
 
 def list_threads() -> None:
-    """List all threads and their status."""
-    active_dir = Path('thread_management/active_thread')
-    completed_dir = Path('thread_management/completed_threads')
+    """List all threads and their status from the thread index."""
+    index = load_index()
     
     print("\nActive Threads:")
     print("-------------")
-    if active_dir.exists():
-        for file in active_dir.glob('*.json'):
-            with open(file) as f:
-                data = json.load(f)
-                print(f"{data['thread_id']}: {data['name']} (Status: {data['status']})")
+    for thread_id, entry in index['active'].items():
+        print(f"{thread_id}: {entry['name']} (Status: {entry['status']})")
     
     print("\nCompleted Threads:")
     print("----------------")
-    if completed_dir.exists():
-        for file in completed_dir.glob('*.json'):
-            with open(file) as f:
-                data = json.load(f)
-                print(f"{data['thread_id']}: {data['name']} (Completed)")
+    for thread_id, entry in index['completed'].items():
+        print(f"{thread_id}: {entry['name']} (Completed)")
 
 def main():
     """Main entry point."""
@@ -1,9 +1,20 @@
 import json
+from pathlib import Path
+
+CONFIG_PATH = Path("config/config.json")
+
+# (section, key, expected value, error message), checked in order
+VALUE_CHECKS = (
+    ("risk_management", "max_position_size", 1, "max_position_size is not set to 1"),
+    ("risk_management", "stop_loss_pct", 2, "stop_loss_pct is not set to 2"),
+    ("risk_management", "max_daily_loss", 500, "max_daily_loss is not set to 500"),
+    ("risk_management", "max_open_orders", 2, "max_open_orders is not set to 2"),
+    ("logging", "level", "DEBUG", "logging level is not set to DEBUG"),
+)
 
 def verify_paper_trading_config():
     try:
-        with open("config/config.json", "r") as f:
-            config = json.load(f)
+        config = json.loads(CONFIG_PATH.read_bytes())
     except FileNotFoundError:
         print("Error: config.json not found.")
         return False
@@ -12,38 +23,20 @@ def verify_paper_trading_config():
         print("Error: paper_trading is not set to true.")
         return False
 
-    risk_management = config.get("risk_management")
-    if not risk_management:
-        print("Error: risk_management section not found.")
-        return False
-
-    if risk_management.get("max_position_size") != 1:
-        print("Error: max_position_size is not set to 1.")
-        return False
-
-    if risk_management.get("stop_loss_pct") != 2:
-        print("Error: stop_loss_pct is not set to 2.")
-        return False
-
-    if risk_management.get("max_daily_loss") != 500:
-        print("Error: max_daily_loss is not set to 500.")
-        return False
-
-    if risk_management.get("max_open_orders") != 2:
-        print("Error: max_open_orders is not set to 2.")
-        return False
+    sections = {}
+    for section in ("risk_management", "logging"):
+        sections[section] = config.get(section)
+        if not sections[section]:
+            print(f"Error: {section} section not found.")
+            return False
 
-    logging_config = config.get("logging")
-    if not logging_config:
-        print("Error: logging section not found.")
-        return False
-
-    if logging_config.get("level") != "DEBUG":
-        print("Error: logging level is not set to DEBUG.")
-        return False
+    for section, key, expected, message in VALUE_CHECKS:
+        if sections[section].get(key) != expected:
+            print(f"Error: {message}.")
+            return False
 
     print("Paper trading configuration is valid.")
     return True
 
 if __name__ == "__main__":
-    verify_paper_trading_config()
\ No newline at end of file
+    verify_paper_trading_config()
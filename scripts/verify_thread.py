@@ -1,14 +1,48 @@
 """Thread verification script for crypto_trader_clean project."""
 import os
 import sys
-import json
 import argparse
 import logging
-import subprocess
 import re
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+# TOTAL row of a pytest-cov report with branch coverage
+_TOTAL_RE = re.compile(r'TOTAL\s+\d+\s+\d+\s+\d+\s+\d+\s+(\d+)%')
+# The coverage report ends the output apart from pytest's short test summary,
+# so only this many trailing characters are searched for the TOTAL row
+_TOTAL_TAIL = 65536
+# Lines of streamed pytest output kept for parse_coverage_output
+_TAIL_LINES = 1000
+
+def _subdir_names(directory: Path) -> set:
+    """Return the names of the subdirectories of directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+def _find_dirs_named(root: Path, name: str, max_depth: int = 2) -> List[Path]:
+    """Find directories called name up to max_depth levels below root."""
+    found = []
+    level = [root]
+    for _ in range(max_depth):
+        next_level = []
+        for directory in level:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name == name:
+                                found.append(Path(entry.path))
+                            next_level.append(entry.path)
+            except OSError:
+                continue
+        level = next_level
+    return found
+
 def setup_logging() -> None:
     """Configure logging for the verification script."""
 
@@ -22,6 +56,7 @@ def verify_project_root() -> bool:
 
 def check_directories() -> Dict[str, Any]:
     """Check for correct directory structure and no duplicates."""
+    cwd = Path.cwd()
     results = {
         "status": "clean",
         "no_duplicates": True,
@@ -39,15 +74,19 @@ def check_directories() -> Dict[str, Any]:
         'thread_management'
     ]
     
+    # List each parent once and check the required names against it
+    listings: Dict[str, set] = {}
     for dir_path in required_dirs:
-        full_path = Path(dir_path)
-        if not full_path.exists():
+        parent, _, name = dir_path.rpartition('/')
+        if parent not in listings:
+            listings[parent] = _subdir_names(cwd / parent)
+        if name not in listings[parent]:
             results["status"] = "incomplete"
             results["issues"].append(f"Missing directory: {dir_path}")
             
     # Check for duplicate directories
-    parent_dir = Path.cwd().parent
-    duplicates = list(parent_dir.glob("**/crypto_trader_clean"))
+    parent_dir = cwd.parent
+    duplicates = _find_dirs_named(parent_dir, "crypto_trader_clean")
     if len(duplicates) > 1:
         results["no_duplicates"] = False
         results["issues"].extend([
@@ -58,6 +97,7 @@ def check_directories() -> Dict[str, Any]:
 
 def check_environment() -> Dict[str, Any]:
     """Verify Python environment setup."""
+    cwd = Path.cwd()
     results = {
         "venv_active": False,
         "pythonpath_valid": False,
@@ -73,7 +113,7 @@ def check_environment() -> Dict[str, Any]:
     # Check PYTHONPATH more robustly
     python_path = os.environ.get('PYTHONPATH', '')
     print(f"Current PYTHONPATH: {python_path}")
-    project_root = str(Path.cwd().resolve())
+    project_root = str(cwd.resolve())
     valid = False
     for path in python_path.split(';'):
         try:
@@ -99,7 +139,7 @@ def parse_coverage_output(output: str) -> Optional[float]:
         Total coverage percentage as a float, or None if parsing failed
     """
     # Look for the TOTAL line at the end of the coverage report
-    match = re.search(r'TOTAL\s+\d+\s+\d+\s+\d+\s+\d+\s+(\d+)%', output)
+    match = _TOTAL_RE.search(output[-_TOTAL_TAIL:])
     if match:
         return float(match.group(1))
     return None
@@ -113,26 +153,30 @@ def check_coverage(threshold: float = 85.0) -> Tuple[bool, Optional[float]]:
     Returns:
         Tuple of (meets_threshold, coverage_percentage)
     """
+    import subprocess
+
     print("Running test coverage check...")
     try:
-        # Run pytest with coverage using the specified command
-        result = subprocess.run(
+        # Run pytest with coverage, echoing output as it arrives and keeping
+        # only the tail needed to find the TOTAL row
+        tail = deque(maxlen=_TAIL_LINES)
+        with subprocess.Popen(
             ["pytest", "--maxfail=1", "--disable-warnings", "--cov=.", "--cov-report=term"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Print stdout for visualization
-        print(result.stdout)
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
         
-        if result.returncode != 0:
-            print("Test coverage check failed to complete:")
-            print(result.stderr)
+        if proc.returncode != 0:
+            print("Test coverage check failed to complete.")
             return False, None
         
         # Parse the coverage percentage
-        coverage_percentage = parse_coverage_output(result.stdout)
+        coverage_percentage = parse_coverage_output(''.join(tail))
         
         if coverage_percentage is None:
             print("Failed to parse coverage percentage from output.")
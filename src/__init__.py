@@ -1,35 +1,36 @@
 """
 CryptoTrader Clean - A streamlined cryptocurrency trading system.
-"""
-from .core import (
-    OrderExecutor,
-    TradingCore,
-    ConfigManager,
-    TradingConfig,
-    RiskConfig
-)
 
-from .utils.exceptions import (
-    TradingException,
-    OrderExecutionError,
-    ValidationError,
-    PositionError,
-    ConfigurationError,
-    ExchangeError
-)
+Public names are imported on first access (PEP 562), so importing the
+package does not load the trading stack and its third-party dependencies.
+"""
+import importlib
 
 __version__ = '0.1.0'
 
-__all__ = [
-    'OrderExecutor',
-    'TradingCore',
-    'ConfigManager',
-    'TradingConfig',
-    'RiskConfig',
-    'TradingException',
-    'OrderExecutionError',
-    'ValidationError',
-    'PositionError',
-    'ConfigurationError',
-    'ExchangeError'
-]
+_LAZY = {
+    'OrderExecutor': '.core',
+    'TradingCore': '.core',
+    'ConfigManager': '.core',
+    'TradingConfig': '.core',
+    'RiskConfig': '.core',
+    'TradingException': '.utils.exceptions',
+    'OrderExecutionError': '.utils.exceptions',
+    'ValidationError': '.utils.exceptions',
+    'PositionError': '.utils.exceptions',
+    'ConfigurationError': '.utils.exceptions',
+    'ExchangeError': '.utils.exceptions'
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
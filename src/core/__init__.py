@@ -1,12 +1,27 @@
-"""Core trading system components."""
-from .order_executor import OrderExecutor
-from .trading_core import TradingCore
-from .config_manager import ConfigManager, TradingConfig, RiskConfig
-
-__all__ = [
-    'OrderExecutor',
-    'TradingCore',
-    'ConfigManager',
-    'TradingConfig',
-    'RiskConfig'
-]
+"""Core trading system components.
+
+Classes are imported on first access (PEP 562), so importing one submodule
+such as src.core.config_manager does not load the exchange clients.
+"""
+import importlib
+
+_LAZY = {
+    'OrderExecutor': '.order_executor',
+    'TradingCore': '.trading_core',
+    'ConfigManager': '.config_manager',
+    'TradingConfig': '.config_manager',
+    'RiskConfig': '.config_manager'
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,35 @@
+"""
+HMAC-SHA256 request signing shared by the Coinbase streaming clients.
+"""
+import hmac
+from base64 import b64encode
+
+
+def prehash(timestamp: str, method: str, request_path: str, body: str = '') -> bytes:
+    """
+    Build the message that Coinbase expects to be signed.
+
+    Args:
+        timestamp: Unix timestamp in seconds, as a string
+        method: HTTP method, e.g. 'GET'
+        request_path: API path being authorized
+        body: Request body, empty for GET requests
+
+    Returns:
+        bytes: The UTF-8 encoded prehash message
+    """
+    return f"{timestamp}{method}{request_path}{body}".encode('utf-8')
+
+
+def sign(secret: bytes, msg: bytes) -> str:
+    """
+    Sign a message with HMAC-SHA256 and return the base64 signature.
+
+    Args:
+        secret: The API secret as bytes
+        msg: The prehash message (timestamp + method + path + body) as bytes
+
+    Returns:
+        str: The base64 encoded signature
+    """
+    return b64encode(hmac.digest(secret, msg, 'sha256')).decode('ascii')
@@ -11,12 +11,10 @@ import logging
 import os
 import time
 import websockets
-import hmac
-import hashlib
 from typing import List, Dict, Any, Optional
-from base64 import b64encode
 from coinbase_advanced_trade.rest import RESTClient  # Updated to coinbase-advanced-trade library
 from ..utils.exceptions import StreamingError
+from ._signing import prehash, sign
 
 # Configure the module logger
 logger = logging.getLogger(__name__)
@@ -99,13 +97,8 @@ class CoinbaseStreaming:
             method = 'GET'
             request_path = '/api/v3/brokerage/accounts'
             body = ''
-            message = timestamp + method + request_path + body
-            signature = hmac.new(
-                self.private_key.encode('utf-8'),
-                message.encode('utf-8'),
-                digestmod=hashlib.sha256
-            ).digest()
-            signature_b64 = b64encode(signature).decode('utf-8')
+            message = prehash(timestamp, method, request_path, body)
+            signature_b64 = sign(self.private_key.encode('utf-8'), message)
 
             auth_message = {
                 "type": "subscribe",
@@ -209,7 +209,7 @@ class ConfigManager:
             raise ConfigurationError("Configuration file not found")
 
         try:
-            with open(self.config_file_path, "r") as f:
+            with open(self.config_file_path, "r", encoding="utf-8") as f:
                 config_data = json.load(f)
         except json.JSONDecodeError:
             raise ConfigurationError("Invalid JSON in configuration file")
@@ -281,7 +281,7 @@ class ConfigManager:
             raise ConfigurationError("Configuration not loaded")
 
         # Load current config as dictionary
-        with open(self.config_file_path, "r") as f:
+        with open(self.config_file_path, "r", encoding="utf-8") as f:
             config_data = json.load(f)
 
         # Apply updates
@@ -293,7 +293,7 @@ class ConfigManager:
 
         # Save updated config
         try:
-            with open(self.config_file_path, "w") as f:
+            with open(self.config_file_path, "w", encoding="utf-8") as f:
                 json.dump(config_data, f, indent=4)
         except Exception as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
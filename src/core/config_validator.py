@@ -30,7 +30,7 @@ class ConfigValidator:
             ConfigurationError: If the schema file is not found or is invalid JSON.
         """
         try:
-            with open(self.schema_path, 'r') as f:
+            with open(self.schema_path, 'r', encoding='utf-8') as f:
                 schema = json.load(f)
             Draft202012Validator.check_schema(schema)
             return schema
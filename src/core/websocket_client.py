@@ -11,11 +11,9 @@ import json
 import logging
 import time
 import websockets
-import hmac
-import hashlib
-from base64 import b64encode
 from typing import List, Optional, Dict, Any
 from ..utils.exceptions import StreamingError
+from ._signing import prehash, sign
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -81,13 +79,8 @@ class WebsocketClient:
             method = 'GET'
             request_path = '/api/v3/brokerage/accounts'
             body = ''
-            message = timestamp + method + request_path + body
-            signature = hmac.new(
-                self.api_secret.encode('utf-8'),
-                message.encode('utf-8'),
-                digestmod=hashlib.sha256
-            ).digest()
-            signature_b64 = b64encode(signature).decode('utf-8')
+            message = prehash(timestamp, method, request_path, body)
+            signature_b64 = sign(self.api_secret.encode('utf-8'), message)
             
             auth_payload: Dict[str, Any] = {
                 "type": "authenticate",
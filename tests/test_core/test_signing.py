@@ -0,0 +1,19 @@
+import base64
+import hashlib
+import hmac
+
+from src.core._signing import prehash, sign
+
+def test_sign_matches_hmac_sha256():
+    """Test that sign returns the base64 HMAC-SHA256 of the message."""
+    secret = b'test_secret'
+    message = b'1700000000GET/api/v3/brokerage/accounts'
+    expected = base64.b64encode(
+        hmac.new(secret, message, hashlib.sha256).digest()
+    ).decode('utf-8')
+    assert sign(secret, message) == expected
+
+def test_prehash_concatenates_request_fields():
+    """Test that prehash joins timestamp, method, path and body as bytes."""
+    message = prehash('1700000000', 'GET', '/api/v3/brokerage/accounts')
+    assert message == b'1700000000GET/api/v3/brokerage/accounts'
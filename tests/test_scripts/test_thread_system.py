@@ -59,7 +59,7 @@ def test_thread_template():
 
 def test_thread_manager():
     """Test thread manager functionality."""
-    from scripts.thread_manager import init_thread, get_thread_status, complete_thread
+    from scripts.thread_manager import init_thread, get_thread_status, complete_thread, load_index
     
     # Initialize test thread
     thread_id = "THREAD_TEST_THREAD"  # Use correct format to match init_thread behavior
@@ -69,6 +69,7 @@ def test_thread_manager():
     status = get_thread_status(thread_id)
     assert status['thread_id'] == thread_id
     assert status['status'] == 'not_started'
+    assert thread_id in load_index()['active']
     
     # Complete thread
     complete_thread(thread_id)
@@ -76,10 +77,60 @@ def test_thread_manager():
     # Verify thread was archived
     archive_path = Path(f'thread_management/completed_threads/{thread_id}.json')
     assert archive_path.exists()
+    index = load_index()
+    assert thread_id in index['completed']
+    assert thread_id not in index['active']
     
     # Cleanup
     archive_path.unlink()
 
+def test_thread_index_sees_in_place_edits():
+    """Test that load_index picks up a thread file edited in place."""
+    from scripts.thread_manager import init_thread, load_index, ACTIVE_DIR
+    
+    thread_id = "THREAD_TEST_INDEX_EDIT"
+    init_thread(thread_id)
+    config_path = ACTIVE_DIR / f"{thread_id}.json"
+    try:
+        assert load_index()['active'][thread_id]['status'] == 'not_started'
+        
+        # Rewrite the file in place, as an editor would
+        config = json.loads(config_path.read_text())
+        config['status'] = 'in_progress'
+        config_path.write_text(json.dumps(config, indent=4))
+        
+        assert load_index()['active'][thread_id]['status'] == 'in_progress'
+    finally:
+        config_path.unlink()
+
+def test_thread_index_updates_without_rescan(monkeypatch):
+    """Test that init and complete update a fresh index without rebuilding it."""
+    import time
+    import scripts.thread_manager as thread_manager
+    
+    thread_id = "THREAD_TEST_INDEX_INCREMENTAL"
+    # Let earlier folder changes fall into an older clock tick than the index
+    time.sleep(0.05)
+    thread_manager.load_index()
+    
+    def fail_rebuild():
+        raise AssertionError("index was rebuilt")
+    monkeypatch.setattr(thread_manager, '_build_index', fail_rebuild)
+    
+    archive_path = thread_manager.COMPLETED_DIR / f"{thread_id}.json"
+    try:
+        thread_manager.init_thread(thread_id)
+        index = json.loads(thread_manager.INDEX_PATH.read_bytes())
+        assert thread_id in index['active']
+        
+        thread_manager.complete_thread(thread_id)
+        index = json.loads(thread_manager.INDEX_PATH.read_bytes())
+        assert thread_id in index['completed']
+        assert thread_id not in index['active']
+    finally:
+        if archive_path.exists():
+            archive_path.unlink()
+
 def test_verify_thread():
     """Test thread verification functionality."""
     from scripts.verify_thread import check_directories, check_environment